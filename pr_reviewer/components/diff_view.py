@@ -2,9 +2,18 @@
 
 import reflex as rx
 
-from pr_reviewer.constants import FileStatus
+from pr_reviewer.constants import MAX_RENDERED_DIFF_LINES, FileStatus
+from pr_reviewer.services.highlight import diff_styles
 from pr_reviewer.state import PRDataState
 
+_DIFF_CSS = diff_styles()
+
+# Resolved once at import; these are rebuilt on every component tree
+# construction otherwise.
+_BORDER = f"1px solid {rx.color('gray', 5)}"
+_GRAY_7 = rx.color("gray", 7)
+_GRAY_9 = rx.color("gray", 9)
+
 
 def diff_header() -> rx.Component:
     """Header showing filename and change stats."""
@@ -12,23 +21,15 @@ def diff_header() -> rx.Component:
         rx.text(PRDataState.selected_file, weight="bold", size="3"),
         rx.spacer(),
         rx.hstack(
-            rx.cond(
-                PRDataState.selected_file_additions > 0,
-                rx.text(
-                    "+" + PRDataState.selected_file_additions.to_string(),  # pyright: ignore[reportAttributeAccessIssue]
-                    color="green",
-                    size="2",
-                ),
-                rx.fragment(),
+            rx.text(
+                PRDataState.selected_file_additions_label,
+                color="green",
+                size="2",
             ),
-            rx.cond(
-                PRDataState.selected_file_deletions > 0,
-                rx.text(
-                    "-" + PRDataState.selected_file_deletions.to_string(),  # pyright: ignore[reportAttributeAccessIssue]
-                    color="red",
-                    size="2",
-                ),
-                rx.fragment(),
+            rx.text(
+                PRDataState.selected_file_deletions_label,
+                color="red",
+                size="2",
             ),
             rx.badge(
                 PRDataState.selected_file_status,
@@ -50,17 +51,54 @@ def diff_header() -> rx.Component:
     )
 
 
+@rx.memo
+def diff_code_block(code: str) -> rx.Component:
+    """Syntax-highlighted diff block, memoized on the diff text.
+
+    The rx.memo boundary means Prism only re-tokenizes when the diff itself
+    changes, not on unrelated state updates like review streaming or hover.
+    """
+    return rx.code_block(
+        code,
+        language="diff",
+        show_line_numbers=True,
+        wrap_long_lines=True,
+        font_size="13px",
+    )
+
+
+@rx.memo
+def server_highlighted_diff(html: str) -> rx.Component:
+    """Server-highlighted pane for diffs too large to tokenize client-side.
+
+    The HTML arrives pre-highlighted (and cached) from Pygments, so the
+    browser only paints spans instead of running Prism.
+    """
+    return rx.box(
+        rx.el.style(_DIFF_CSS),
+        rx.html(html, width="100%"),
+        width="100%",
+    )
+
+
 def diff_content() -> rx.Component:
     """Display the diff content with syntax highlighting."""
     return rx.cond(
         PRDataState.selected_file_has_diff,
         rx.scroll_area(
-            rx.code_block(
-                PRDataState.selected_file_diff,
-                language="diff",
-                show_line_numbers=True,
-                wrap_long_lines=True,
-                font_size="13px",
+            rx.cond(
+                PRDataState.rendered_diff_truncated,
+                rx.text(
+                    f"Showing the first {MAX_RENDERED_DIFF_LINES} lines of this diff",
+                    color="gray",
+                    size="1",
+                    padding_bottom="1",
+                ),
+            ),
+            rx.cond(
+                PRDataState.rendered_diff_is_large,
+                server_highlighted_diff(html=PRDataState.rendered_diff_html),
+                diff_code_block(code=PRDataState.rendered_diff),
             ),
             type="auto",
             scrollbars="both",
@@ -69,7 +107,7 @@ def diff_content() -> rx.Component:
         ),
         rx.box(
             rx.vstack(
-                rx.icon("file-x", size=32, color=rx.color("gray", 9)),
+                rx.icon("file-x", size=32, color=_GRAY_9),
                 rx.text("No diff available", color="gray", size="3"),
                 rx.text(
                     "This file may be binary or too large to display",
@@ -87,8 +125,13 @@ def diff_content() -> rx.Component:
     )
 
 
+@rx.memo
 def diff_view() -> rx.Component:
-    """Component for displaying the diff of a selected file."""
+    """Component for displaying the diff of a selected file.
+
+    Memoized so the page doesn't rebuild this subtree when unrelated
+    sibling state (settings, review streaming) changes.
+    """
     return rx.cond(
         PRDataState.selected_file != "",
         rx.box(
@@ -104,7 +147,7 @@ def diff_view() -> rx.Component:
             ),
             padding="3",
             border_radius="lg",
-            border=f"1px solid {rx.color('gray', 5)}",
+            border=_BORDER,
             width="100%",
             height="100%",
             display="flex",
@@ -112,7 +155,7 @@ def diff_view() -> rx.Component:
         ),
         rx.box(
             rx.vstack(
-                rx.icon("file-code", size=48, color=rx.color("gray", 7)),
+                rx.icon("file-code", size=48, color=_GRAY_7),
                 rx.text("Select a file to view its diff", color="gray", size="3"),
                 spacing="3",
                 align="center",
@@ -2,31 +2,30 @@
 
 import reflex as rx
 
-from pr_reviewer.constants import FileStatus
 from pr_reviewer.state import PRDataState
 
+# Resolved once at import rather than per row render.
+_DRAWER_BG = rx.color("gray", 1)
 
-def file_status_indicator(status: str) -> rx.Component:
-    """Return an icon based on file status."""
-    return rx.match(  # pyright: ignore[reportReturnType]
-        status,
-        (FileStatus.ADDED, rx.text("+", color="green", weight="bold", size="2")),
-        (FileStatus.REMOVED, rx.text("-", color="red", weight="bold", size="2")),
-        (FileStatus.RENAMED, rx.text("R", color="orange", weight="bold", size="2")),
-        rx.text("M", color="blue", weight="bold", size="2"),  # default: modified
-    )
 
+@rx.memo
+def file_list_item(file: dict, selected: bool) -> rx.Component:
+    """Render a single file item.
 
-def file_list_item(file: dict) -> rx.Component:
-    """Render a single file item."""
+    Memoized on (file, selected) so changing the selection only
+    re-renders the two rows whose highlight actually changed instead of
+    every row in the list.
+    """
     filename = file["filename"]
-    status = file["status"]
-    additions = file["additions"].to(int)
-    deletions = file["deletions"].to(int)
 
     return rx.box(
         rx.hstack(
-            file_status_indicator(status),
+            rx.text(
+                file["status_glyph"],
+                color=file["status_color"],
+                weight="bold",
+                size="2",
+            ),
             rx.text(
                 filename,
                 size="2",
@@ -34,16 +33,8 @@ def file_list_item(file: dict) -> rx.Component:
                 flex="1",
             ),
             rx.hstack(
-                rx.cond(
-                    additions > 0,
-                    rx.text(rx.Var.create(f"+{additions}"), color="green", size="1"),
-                    rx.fragment(),
-                ),
-                rx.cond(
-                    deletions > 0,
-                    rx.text(rx.Var.create(f"-{deletions}"), color="red", size="1"),
-                    rx.fragment(),
-                ),
+                rx.text(file["additions_label"], color="green", size="1"),
+                rx.text(file["deletions_label"], color="red", size="1"),
                 spacing="1",
             ),
             spacing="2",
@@ -53,16 +44,18 @@ def file_list_item(file: dict) -> rx.Component:
         padding="2",
         border_radius="md",
         cursor="pointer",
-        _hover={"background": rx.color("gray", 3)},
-        background=rx.cond(
-            PRDataState.selected_file == filename,
-            rx.color("blue", 3),
-            "transparent",
-        ),
-        on_click=[
-            lambda: PRDataState.select_file(filename),  # pyright: ignore[reportCallIssue]
-            PRDataState.close_file_drawer,  # pyright: ignore[reportArgumentType]
-        ],
+        # Let the browser skip rendering rows outside the viewport so large
+        # PRs don't pay layout/paint cost for every file at once.
+        style={
+            "content_visibility": "auto",
+            "contain_intrinsic_size": "auto 36px",
+        },
+        # Hover/selected backgrounds are handled by the .file-row rules in
+        # the app stylesheet, keyed off data-selected, so selection changes
+        # don't touch inline styles on every row.
+        class_name="file-row",
+        custom_attrs={"data-selected": rx.cond(selected, "true", "false")},
+        on_click=PRDataState.select_and_close(filename),  # pyright: ignore[reportCallIssue]
     )
 
 
@@ -84,7 +77,13 @@ def file_drawer_content() -> rx.Component:
         rx.divider(),
         rx.scroll_area(
             rx.vstack(
-                rx.foreach(PRDataState.files, file_list_item),
+                rx.foreach(
+                    PRDataState.files,
+                    lambda file: file_list_item(
+                        file=file,
+                        selected=PRDataState.selected_file == file["filename"],
+                    ),
+                ),
                 spacing="1",
                 width="100%",
             ),
@@ -109,7 +108,7 @@ def file_drawer() -> rx.Component:
                 height="100%",
                 width="320px",
                 padding="4",
-                background_color=rx.color("gray", 1),
+                background_color=_DRAWER_BG,
             ),
         ),
         open=PRDataState.file_drawer_open,
@@ -130,5 +129,4 @@ def file_drawer_trigger() -> rx.Component:
             size="2",
             on_click=PRDataState.toggle_file_drawer,  # pyright: ignore[reportArgumentType]
         ),
-        rx.fragment(),
     )
@@ -16,8 +16,13 @@ def settings_button() -> rx.Component:
     )
 
 
+@rx.memo
 def review_all_button() -> rx.Component:
-    """Button to review all files."""
+    """Button to review all files.
+
+    Memoized so streaming review text doesn't re-diff the button; only
+    the progress vars it reads trigger an update.
+    """
     return rx.cond(
         PRDataState.has_pr_loaded,
         rx.cond(
@@ -65,7 +70,6 @@ def review_all_button() -> rx.Component:
                                 color="blue",
                                 variant="soft",
                             ),
-                            rx.fragment(),
                         ),
                         spacing="2",
                     ),
@@ -76,7 +80,6 @@ def review_all_button() -> rx.Component:
                 ),
             ),
         ),
-        rx.fragment(),
     )
 
 
@@ -5,8 +5,13 @@ import reflex as rx
 from pr_reviewer.state import PRDataState
 
 
+@rx.memo
 def pr_url_input() -> rx.Component:
-    """Input section for PR URL."""
+    """Input section for PR URL.
+
+    Memoized so URL keystrokes re-render only the form, not its page
+    siblings.
+    """
     return rx.form(
         rx.hstack(
             rx.input(
@@ -37,6 +42,7 @@ def pr_url_input() -> rx.Component:
     )
 
 
+@rx.memo
 def error_callout() -> rx.Component:
     """Display error messages as a callout."""
     return rx.cond(
@@ -48,5 +54,4 @@ def error_callout() -> rx.Component:
             width="100%",
             max_width="600px",
         ),
-        rx.fragment(),
     )
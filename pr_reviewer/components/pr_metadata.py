@@ -6,12 +6,24 @@ from pr_reviewer.components.file_drawer import file_drawer_trigger
 from pr_reviewer.state import PRDataState
 
 
+@rx.memo
+def description_body(text: str) -> rx.Component:
+    """Markdown body of the PR description, memoized on the text.
+
+    While the section is expanded, unrelated state updates no longer
+    re-run the markdown pipeline on the same description.
+    """
+    return rx.markdown(text, size="2")
+
+
 def pr_description() -> rx.Component:
     """Collapsible PR description section."""
     return rx.cond(
         PRDataState.has_pr_description,
         rx.box(
             rx.hstack(
+                # Click handling lives on the wrapping hstack; a second
+                # handler here would dispatch the toggle event twice.
                 rx.icon_button(
                     rx.cond(
                         PRDataState.description_expanded,
@@ -20,7 +32,6 @@ def pr_description() -> rx.Component:
                     ),
                     variant="ghost",
                     size="1",
-                    on_click=PRDataState.toggle_description,  # pyright: ignore[reportArgumentType]
                 ),
                 rx.text("Description", size="2", weight="medium", color="gray"),
                 spacing="1",
@@ -31,15 +42,13 @@ def pr_description() -> rx.Component:
             rx.cond(
                 PRDataState.description_expanded,
                 rx.box(
-                    rx.markdown(PRDataState.pr_description, size="2"),
+                    description_body(text=PRDataState.visible_description),
                     padding_left="6",
                     padding_top="2",
                 ),
-                rx.fragment(),
             ),
             width="100%",
         ),
-        rx.fragment(),
     )
 
 
@@ -52,12 +61,16 @@ def truncation_warning() -> rx.Component:
             icon="triangle-alert",
             color="orange",
         ),
-        rx.fragment(),
     )
 
 
+@rx.memo
 def pr_metadata() -> rx.Component:
-    """Display PR metadata when loaded."""
+    """Display PR metadata when loaded.
+
+    Memoized so the metadata card is its own React component and skips
+    re-rendering on unrelated state changes.
+    """
 
     return rx.cond(
         PRDataState.has_pr_loaded,
@@ -69,7 +82,7 @@ def pr_metadata() -> rx.Component:
                     rx.badge(PRDataState.pr_author, color="blue"),
                     rx.text("•", color="gray"),
                     rx.text(
-                        PRDataState.pr_base_branch + " ← " + PRDataState.pr_head_branch,
+                        PRDataState.branch_label,
                         color="gray",
                         size="2",
                     ),
@@ -80,19 +93,11 @@ def pr_metadata() -> rx.Component:
                 rx.divider(),
                 rx.hstack(
                     file_drawer_trigger(),
-                    rx.hstack(
-                        rx.text("+", color="green", weight="bold"),
-                        rx.text(PRDataState.total_additions, color="green"),
-                        spacing="1",
-                    ),
-                    rx.hstack(
-                        rx.text("-", color="red", weight="bold"),
-                        rx.text(PRDataState.total_deletions, color="red"),
-                        spacing="1",
-                    ),
+                    rx.text(PRDataState.total_additions_label, color="green"),
+                    rx.text(PRDataState.total_deletions_label, color="red"),
                     rx.text("•", color="gray"),
                     rx.text(
-                        PRDataState.file_count.to_string() + " files changed",  # pyright: ignore[reportAttributeAccessIssue]
+                        PRDataState.file_count_label,
                         color="gray",
                     ),
                     spacing="3",
@@ -104,5 +109,4 @@ def pr_metadata() -> rx.Component:
             ),
             width="100%",
         ),
-        rx.fragment(),
     )
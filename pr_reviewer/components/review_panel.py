@@ -4,11 +4,67 @@ import reflex as rx
 
 from pr_reviewer.state import PRDataState, ReviewState, SettingsState
 
+# Resolved once at import rather than on every panel render.
+_BORDER = f"1px solid {rx.color('gray', 5)}"
 
-def review_button() -> rx.Component:
-    """Button to trigger AI review of the selected file."""
+_CODE_STYLE = {
+    "white_space": "pre-wrap",
+    "word_break": "break-all",
+    "font_size": "12px",
+}
+
+
+def _render_code(text: str) -> rx.Component:
+    return rx.code(text, style=_CODE_STYLE)
+
+
+# Shared markdown component_map, built once so the prop stays
+# referentially stable across renders.
+_COMPONENT_MAP = {"code": _render_code}
+
+# Static placeholder trees, built once at import instead of on every
+# review_content() call.
+_ANALYZING_PLACEHOLDER = rx.box(
+    rx.vstack(
+        rx.spinner(size="3"),
+        rx.text("Analyzing code...", color="gray", size="2"),
+        spacing="3",
+        align="center",
+    ),
+    padding="6",
+    text_align="center",
+    width="100%",
+    flex="1",
+)
+
+_NO_REVIEW_PLACEHOLDER = rx.box(
+    rx.vstack(
+        rx.icon("message-square-text", size=32, color=rx.color("gray", 7)),
+        rx.text("No review yet", color="gray", size="3"),
+        rx.text(
+            "Click the button above to get an AI review",
+            color="gray",
+            size="2",
+        ),
+        spacing="2",
+        align="center",
+    ),
+    padding="6",
+    text_align="center",
+    width="100%",
+    flex="1",
+)
+
+
+@rx.memo
+def review_button(reviewing_selected: bool, review_disabled: bool) -> rx.Component:
+    """Button to trigger AI review of the selected file.
+
+    Memoized on two booleans so streaming review text and other
+    unrelated state churn never re-diff the button subtree.
+    """
     return rx.cond(
-        ReviewState.is_reviewing_selected_file,
+        reviewing_selected,
         rx.button(
             rx.hstack(
                 rx.spinner(size="1"),
@@ -25,49 +81,51 @@ def review_button() -> rx.Component:
                 spacing="2",
             ),
             on_click=ReviewState.review_file,  # pyright: ignore[reportArgumentType]
-            disabled=~PRDataState.selected_file_has_diff | ReviewState.is_reviewing,
+            disabled=review_disabled,
             width="100%",
         ),
     )
 
 
+@rx.memo
+def review_body(text: str) -> rx.Component:
+    """Markdown body of a review, memoized on the review text.
+
+    The memo boundary means the remark pipeline only re-parses when the
+    review text itself changes — not when unrelated state (selection,
+    settings, progress counters) ticks.
+    """
+    return rx.box(
+        rx.markdown(
+            text,
+            component_map=_COMPONENT_MAP,
+        ),
+        padding="4",
+        width="100%",
+        font_size="14px",
+        style={
+            "word_wrap": "break-word",
+            "overflow_wrap": "break-word",
+            "& pre": {
+                "white_space": "pre-wrap",
+                "word_break": "break-all",
+                "font_size": "12px",
+            },
+            "& code": {
+                "white_space": "pre-wrap",
+                "word_break": "break-all",
+                "font_size": "12px",
+            },
+        },
+    )
+
+
 def review_content() -> rx.Component:
     """Display the AI review content."""
     return rx.cond(
         ReviewState.has_selected_file_review,
         rx.scroll_area(
-            rx.box(
-                rx.markdown(
-                    ReviewState.selected_file_review,
-                    component_map={
-                        "code": lambda text: rx.code(
-                            text,
-                            style={
-                                "white_space": "pre-wrap",
-                                "word_break": "break-all",
-                                "font_size": "12px",
-                            },
-                        ),
-                    },
-                ),
-                padding="4",
-                width="100%",
-                font_size="14px",
-                style={
-                    "word_wrap": "break-word",
-                    "overflow_wrap": "break-word",
-                    "& pre": {
-                        "white_space": "pre-wrap",
-                        "word_break": "break-all",
-                        "font_size": "12px",
-                    },
-                    "& code": {
-                        "white_space": "pre-wrap",
-                        "word_break": "break-all",
-                        "font_size": "12px",
-                    },
-                },
-            ),
+            review_body(text=ReviewState.selected_file_review),
             type="auto",
             scrollbars="both",
             flex="1",
@@ -76,35 +134,8 @@ def review_content() -> rx.Component:
         ),
         rx.cond(
             ReviewState.is_reviewing_selected_file,
-            rx.box(
-                rx.vstack(
-                    rx.spinner(size="3"),
-                    rx.text("Analyzing code...", color="gray", size="2"),
-                    spacing="3",
-                    align="center",
-                ),
-                padding="6",
-                text_align="center",
-                width="100%",
-                flex="1",
-            ),
-            rx.box(
-                rx.vstack(
-                    rx.icon("message-square-text", size=32, color=rx.color("gray", 7)),
-                    rx.text("No review yet", color="gray", size="3"),
-                    rx.text(
-                        "Click the button above to get an AI review",
-                        color="gray",
-                        size="2",
-                    ),
-                    spacing="2",
-                    align="center",
-                ),
-                padding="6",
-                text_align="center",
-                width="100%",
-                flex="1",
-            ),
+            _ANALYZING_PLACEHOLDER,
+            _NO_REVIEW_PLACEHOLDER,
         ),
     )
 
@@ -119,7 +150,6 @@ def review_error_display() -> rx.Component:
             color="red",
             size="1",
         ),
-        rx.fragment(),
     )
 
 
@@ -139,7 +169,11 @@ def review_panel() -> rx.Component:
                     width="100%",
                 ),
                 rx.divider(),
-                review_button(),
+                review_button(
+                    reviewing_selected=ReviewState.is_reviewing_selected_file,
+                    review_disabled=~PRDataState.selected_file_has_diff
+                    | ReviewState.is_reviewing,
+                ),
                 review_error_display(),
                 review_content(),
                 spacing="3",
@@ -152,12 +186,11 @@ def review_panel() -> rx.Component:
             ),
             padding="3",
             border_radius="lg",
-            border=f"1px solid {rx.color('gray', 5)}",
+            border=_BORDER,
             width="100%",
             height="100%",
             display="flex",
             flex_direction="column",
             overflow="hidden",
         ),
-        rx.fragment(),
     )
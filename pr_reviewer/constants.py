@@ -37,24 +37,54 @@ PROVIDERS = {
     Provider.OPENAI: ("OpenAI", OPENAI_MODELS),
 }
 
+# Display glyph and color for each file status, resolved server-side so
+# rows don't need a client-side match over the status string.
+STATUS_GLYPHS = {
+    FileStatus.ADDED: ("+", "green"),
+    FileStatus.REMOVED: ("-", "red"),
+    FileStatus.RENAMED: ("R", "orange"),
+    FileStatus.MODIFIED: ("M", "blue"),
+}
+DEFAULT_STATUS_GLYPH = ("M", "blue")
+
+# Cap on how many diff lines are handed to the syntax highlighter.
+# Very large patches (4k+ line generated files) otherwise block the
+# main thread on tokenization.
+MAX_RENDERED_DIFF_LINES = 1000
+
+# Above this many lines, skip syntax highlighting entirely and render the
+# diff as plain preformatted text so tokenization can't jank the UI.
+MAX_HIGHLIGHTED_DIFF_LINES = 400
+
+# How many files "Review All" streams at once. Kept small to stay well
+# under provider rate limits.
+MAX_CONCURRENT_REVIEWS = 3
+
 DEFAULT_PROVIDER = Provider.ANTHROPIC
 DEFAULT_MODEL_KEY = "sonnet"
 DEFAULT_MODEL = ANTHROPIC_MODELS[DEFAULT_MODEL_KEY][0]
 
+# Per-provider (model_id, display_name) lists and default models, built
+# once at import so the lookups below return the same list objects every
+# call instead of re-running a comprehension. Keyed as plain str (the
+# StrEnum members hash as their values) so lookups with str-typed state
+# vars type-check.
+_PROVIDER_MODEL_LISTS: dict[str, list[tuple[str, str]]] = {
+    provider: [(model_id, display) for model_id, display in models.values()]
+    for provider, (_, models) in PROVIDERS.items()
+}
+
+_PROVIDER_DEFAULT_MODELS: dict[str, str] = {
+    Provider.ANTHROPIC: ANTHROPIC_MODELS["sonnet"][0],
+    Provider.OPENAI: OPENAI_MODELS["gpt-5.2"][0],
+}
+
 
 def get_models_for_provider(provider: str) -> list[tuple[str, str]]:
     """Get list of (model_id, display_name) tuples for a provider."""
-    if provider == Provider.ANTHROPIC:
-        return [(v[0], v[1]) for v in ANTHROPIC_MODELS.values()]
-    elif provider == Provider.OPENAI:
-        return [(v[0], v[1]) for v in OPENAI_MODELS.values()]
-    return []
+    return _PROVIDER_MODEL_LISTS.get(provider, [])
 
 
 def get_default_model_for_provider(provider: str) -> str:
     """Get the default model ID for a provider."""
-    if provider == Provider.ANTHROPIC:
-        return ANTHROPIC_MODELS["sonnet"][0]
-    elif provider == Provider.OPENAI:
-        return OPENAI_MODELS["gpt-5.2"][0]
-    return DEFAULT_MODEL
+    return _PROVIDER_DEFAULT_MODELS.get(provider, DEFAULT_MODEL)
@@ -15,37 +15,34 @@ from pr_reviewer.components import (
 from pr_reviewer.state import PRDataState
 
 
+@rx.memo
 def main_content() -> rx.Component:
     """Main content area with diff view and review panel."""
 
     return rx.cond(
         PRDataState.has_pr_loaded,
-        rx.fragment(
-            file_drawer(),  # Drawer - renders as overlay
-            rx.hstack(
-                rx.box(
-                    diff_view(),
-                    flex="1",
-                    min_width="0",
-                    overflow="hidden",
-                    height="100%",
-                ),
-                rx.box(
-                    review_panel(),
-                    width="40%",
-                    min_width="400px",
-                    flex_shrink="0",
-                    height="100%",
-                    overflow="hidden",
-                ),
-                spacing="4",
-                width="100%",
-                align="stretch",
+        rx.hstack(
+            rx.box(
+                diff_view(),
                 flex="1",
-                min_height="0",
+                min_width="0",
+                overflow="hidden",
+                height="100%",
             ),
+            rx.box(
+                review_panel(),
+                width="40%",
+                min_width="400px",
+                flex_shrink="0",
+                height="100%",
+                overflow="hidden",
+            ),
+            spacing="4",
+            width="100%",
+            align="stretch",
+            flex="1",
+            min_height="0",
         ),
-        rx.fragment(),
     )
 
 
@@ -53,6 +50,9 @@ def index() -> rx.Component:
     """Main page."""
 
     return rx.box(
+        # Overlay drawer mounts once at page level; its own open state
+        # drives visibility, so it doesn't remount when a PR loads.
+        file_drawer(),
         rx.vstack(
             header(),
             settings_panel(),
@@ -75,5 +75,12 @@ def index() -> rx.Component:
     )
 
 
-app = rx.App()
+app = rx.App(
+    style={
+        # File drawer rows: highlight is driven by CSS attribute selectors
+        # so selecting a file doesn't rewrite inline styles on every row.
+        ".file-row:hover": {"background": rx.color("gray", 3)},
+        ".file-row[data-selected='true']": {"background": rx.color("blue", 3)},
+    }
+)
 app.add_page(index)
@@ -1,25 +1,61 @@
 """GitHub API service for fetching PR data."""
 
+import asyncio
+import random
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 import httpx
+import orjson
 
-# Pattern to match GitHub PR URLs
+# Attempts per request when GitHub answers with a retryable rate limit.
+_MAX_RETRIES = 3
+
+# Bound on the conditional-GET cache below.
+_MAX_CACHED_RESPONSES = 64
+
+# Pattern to match GitHub PR URLs. Compiled with re.ASCII since URLs
+# are ASCII-only, and bounded after the PR number so trailing path
+# segments or query strings don't leak into the match.
 PR_URL_PATTERN = re.compile(
-    r"https?://(?:www\.)?github\.com/([^/]+)/([^/]+)/pull/(\d+)"
+    r"^https?://(?:www\.)?github\.com/([^/\s]+)/([^/\s]+)/pull/(\d+)(?:[/?#]|$)",
+    re.ASCII,
 )
 
+# Shared client so the metadata and files calls (and each pagination
+# page) reuse pooled connections instead of paying a TCP+TLS handshake
+# per request. Created lazily to bind to the running event loop.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared GitHub API client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=30.0,
+        )
+    return _client
 
+
+@lru_cache(maxsize=128)
 def parse_pr_url(url: str) -> Optional[tuple[str, str, int]]:
     """Parse a GitHub PR URL into (owner, repo, pr_number).
 
+    Cached since the same URL is typically submitted repeatedly, with a
+    substring fast-reject so obviously wrong input skips the regex.
+
     Args:
         url: GitHub PR URL like https://github.com/owner/repo/pull/123
 
     Returns:
         Tuple of (owner, repo, pr_number) or None if URL is invalid.
     """
+    if "github.com/" not in url:
+        return None
     match = PR_URL_PATTERN.match(url.strip())
     if not match:
         return None
@@ -57,6 +93,16 @@ def _parse_link_header(link_header: str) -> Optional[str]:
     if not link_header:
         return None
 
+    # Fast path: GitHub puts rel="next" in the first segment while more
+    # pages remain, so slice it out without splitting the whole header.
+    first_comma = link_header.find(",")
+    first = link_header if first_comma < 0 else link_header[:first_comma]
+    if 'rel="next"' in first:
+        start = first.find("<")
+        end = first.find(">", start)
+        if start >= 0 and end > start:
+            return first[start + 1 : end]
+
     for part in link_header.split(","):
         section = part.split(";")
         if len(section) < 2:
@@ -71,6 +117,130 @@ def _parse_link_header(link_header: str) -> Optional[str]:
     return None
 
 
+async def _get_with_retry(
+    url: str,
+    headers: dict,
+    params: Optional[dict] = None,
+) -> httpx.Response:
+    """GET with backoff on secondary rate limits.
+
+    GitHub signals secondary limits with 429 (or 403 plus Retry-After);
+    those are retried with the advertised delay, capped and jittered.
+    Primary-limit 403s without Retry-After fall through to the caller's
+    error handling.
+
+    Args:
+        url: Request URL.
+        headers: Request headers.
+        params: Optional query parameters.
+
+    Returns:
+        The final response, retried or not.
+    """
+    client = _get_client()
+    response = await client.get(url, headers=headers, params=params)
+    for attempt in range(1, _MAX_RETRIES):
+        retry_after = response.headers.get("Retry-After")
+        if response.status_code == 429:
+            pass
+        elif response.status_code == 403 and retry_after:
+            pass
+        else:
+            break
+        try:
+            delay = float(retry_after) if retry_after else 2.0**attempt
+        except ValueError:
+            delay = 2.0**attempt
+        await asyncio.sleep(min(delay, 60.0) + random.uniform(0, 0.5))
+        response = await client.get(url, headers=headers, params=params)
+    return response
+
+
+# Request key -> (etag, parsed body, next page URL). Re-fetching an
+# unchanged PR sends If-None-Match and GitHub answers 304 with an empty
+# body that doesn't count against the rate limit.
+_etag_cache: dict[str, tuple[str, Any, Optional[str]]] = {}
+
+
+# Identical requests currently on the wire, so a duplicate submit joins
+# the first request instead of issuing its own.
+_inflight: dict[tuple[str, str], "asyncio.Task[tuple[Any, Optional[str]]]"] = {}
+
+
+async def _get_json_cached(
+    url: str,
+    headers: dict,
+    params: Optional[dict],
+    owner: str,
+    repo: str,
+    pr_number: int,
+) -> tuple[Any, Optional[str]]:
+    """Conditional GET returning the parsed body and next-page URL.
+
+    Concurrent calls for the same URL (and auth) are coalesced onto one
+    in-flight request, so a double-clicked submit costs a single fetch.
+
+    Args:
+        url: Request URL.
+        headers: Request headers (not mutated).
+        params: Optional query parameters.
+        owner: Repository owner, for error messages.
+        repo: Repository name, for error messages.
+        pr_number: Pull request number, for error messages.
+
+    Returns:
+        Tuple of (parsed JSON body, next page URL or None).
+
+    Raises:
+        Exception: On API errors with descriptive messages.
+    """
+    key = url if not params else f"{url}?{sorted(params.items())}"
+    inflight_key = (key, headers.get("Authorization", ""))
+    pending = _inflight.get(inflight_key)
+    if pending is not None:
+        return await pending
+
+    task = asyncio.ensure_future(
+        _fetch_json(key, url, headers, params, owner, repo, pr_number)
+    )
+    _inflight[inflight_key] = task
+    try:
+        return await task
+    finally:
+        _inflight.pop(inflight_key, None)
+
+
+async def _fetch_json(
+    key: str,
+    url: str,
+    headers: dict,
+    params: Optional[dict],
+    owner: str,
+    repo: str,
+    pr_number: int,
+) -> tuple[Any, Optional[str]]:
+    """Perform the conditional GET behind _get_json_cached."""
+    cached = _etag_cache.get(key)
+    if cached is not None:
+        headers = {**headers, "If-None-Match": cached[0]}
+
+    response = await _get_with_retry(url, headers, params)
+    if response.status_code == 304 and cached is not None:
+        return cached[1], cached[2]
+    _handle_github_error(response, owner, repo, pr_number)
+
+    # orjson is markedly faster than stdlib json on the multi-hundred-KB
+    # pages that large-patch PRs produce.
+    body = orjson.loads(response.content)
+    next_url = _parse_link_header(response.headers.get("Link", ""))
+    etag = response.headers.get("ETag")
+    if etag:
+        if len(_etag_cache) >= _MAX_CACHED_RESPONSES:
+            _etag_cache.clear()
+        _etag_cache[key] = (etag, body, next_url)
+    return body, next_url
+
+
 def _handle_github_error(
     response: httpx.Response, owner: str, repo: str, pr_number: int
 ) -> None:
@@ -113,10 +283,8 @@ async def fetch_pr_metadata(
     url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}"
     headers = _build_github_headers(token)
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, timeout=30.0)
-        _handle_github_error(response, owner, repo, pr_number)
-        return response.json()
+    body, _ = await _get_json_cached(url, headers, None, owner, repo, pr_number)
+    return body
 
 
 async def fetch_pr_files(
@@ -149,27 +317,30 @@ async def fetch_pr_files(
     files: list[dict] = []
     truncated = False
 
-    async with httpx.AsyncClient() as client:
-        while url and len(files) < max_files:
-            response = await client.get(
-                url,
-                headers=headers,
-                params={"per_page": min(100, max_files - len(files))},
-                timeout=30.0,
-            )
-            _handle_github_error(response, owner, repo, pr_number)
-            page_files = response.json()
-            files.extend(page_files)
-
-            # Check for next page
-            link_header = response.headers.get("Link", "")
-            url = _parse_link_header(link_header)
-
-            # Check if we've hit the limit
-            if len(files) >= max_files:
-                truncated = True
-                files = files[:max_files]
-                break
+    while url and len(files) < max_files:
+        per_page = min(100, max_files - len(files))
+        page_files, next_url = await _get_json_cached(
+            url,
+            headers,
+            {"per_page": per_page},
+            owner,
+            repo,
+            pr_number,
+        )
+        files.extend(page_files)
+
+        # A short page is always the last one; skip the next-page hop
+        # for the common single-page PR.
+        if len(page_files) < per_page:
+            break
+
+        url = next_url
+
+        # Check if we've hit the limit
+        if len(files) >= max_files:
+            truncated = True
+            files = files[:max_files]
+            break
 
     return {
         "files": files,
@@ -1,5 +1,6 @@
 """AI code review service supporting multiple providers."""
 
+import hashlib
 import os
 from collections.abc import AsyncGenerator
 
@@ -8,6 +9,43 @@ import openai
 
 from pr_reviewer.constants import DEFAULT_MODEL, DEFAULT_PROVIDER, Provider
 
+# Completed reviews keyed by (diff hash, model, provider). A review is
+# deterministic enough for a given diff and model that re-clicking Review
+# should not pay the LLM round trip again. Keying on the diff content
+# (rather than PR SHA) also invalidates naturally when the PR is updated.
+_MAX_CACHED_REVIEWS = 256
+
+_review_cache: dict[tuple[str, str, str], str] = {}
+
+# SDK clients cached per API key. Both SDKs wrap an httpx client, so
+# rebuilding them per review meant a fresh TCP+TLS handshake per file;
+# reusing them keeps pooled connections warm across review_all_files.
+_anthropic_clients: dict[str, anthropic.AsyncAnthropic] = {}
+_openai_clients: dict[str, openai.AsyncOpenAI] = {}
+
+
+def _get_anthropic_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Get or create the cached Anthropic client for an API key."""
+    client = _anthropic_clients.get(api_key)
+    if client is None:
+        client = _anthropic_clients[api_key] = anthropic.AsyncAnthropic(api_key=api_key)
+    return client
+
+
+def _get_openai_client(api_key: str) -> openai.AsyncOpenAI:
+    """Get or create the cached OpenAI client for an API key."""
+    client = _openai_clients.get(api_key)
+    if client is None:
+        client = _openai_clients[api_key] = openai.AsyncOpenAI(api_key=api_key)
+    return client
+
+
+def _cache_key(diff: str, model: str, provider: str) -> tuple[str, str, str]:
+    """Build a review cache key from the diff content, model, and provider."""
+    digest = hashlib.blake2b(diff.encode(), digest_size=16).hexdigest()
+    return (digest, model, provider)
+
+
 SYSTEM_PROMPT = """You are an expert code reviewer. Analyze the provided diff and give a concise, actionable review.
 
 Focus on:
@@ -39,44 +77,6 @@ def _build_user_message(filename: str, diff: str) -> str:
 ```"""
 
 
-async def _review_with_anthropic(
-    user_message: str,
-    model: str,
-    api_key: str,
-) -> AsyncGenerator[str, None]:
-    """Stream a review using Anthropic's API."""
-    client = anthropic.AsyncAnthropic(api_key=api_key)
-
-    async with client.messages.stream(
-        model=model,
-        max_tokens=1024,
-        system=SYSTEM_PROMPT,
-        messages=[{"role": "user", "content": user_message}],
-    ) as stream:
-        async for text in stream.text_stream:
-            yield text
-
-
-async def _review_with_openai(
-    user_message: str,
-    model: str,
-    api_key: str,
-) -> AsyncGenerator[str, None]:
-    """Stream a review using OpenAI's Responses API."""
-    client = openai.AsyncOpenAI(api_key=api_key)
-
-    stream = await client.responses.create(
-        model=model,
-        instructions=SYSTEM_PROMPT,
-        input=user_message,
-        stream=True,
-    )
-
-    async for event in stream:
-        if event.type == "response.output_text.delta":
-            yield event.delta
-
-
 async def review_diff(
     filename: str,
     diff: str,
@@ -99,7 +99,17 @@ async def review_diff(
     Raises:
         Exception: On API errors or missing configuration.
     """
+    # The provider SDK streams are iterated directly here rather than
+    # through per-provider generator helpers, so each chunk crosses one
+    # async-generator frame instead of two on the hot streaming path.
+    cache_key = _cache_key(diff, model, provider)
+    cached = _review_cache.get(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
     user_message = _build_user_message(filename, diff)
+    parts: list[str] = []
 
     if provider == Provider.ANTHROPIC:
         key = api_key or os.environ.get("ANTHROPIC_API_KEY")
@@ -108,8 +118,16 @@ async def review_diff(
                 "ANTHROPIC_API_KEY not set. Add it to .env or provide in settings."
             )
         try:
-            async for text in _review_with_anthropic(user_message, model, key):
-                yield text
+            client = _get_anthropic_client(key)
+            async with client.messages.stream(
+                model=model,
+                max_tokens=1024,
+                system=SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": user_message}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    parts.append(text)
+                    yield text
         except anthropic.APIError as e:
             raise Exception(f"Review failed for {filename}: {e}") from e
 
@@ -120,10 +138,23 @@ async def review_diff(
                 "OPENAI_API_KEY not set. Add it to .env or provide in settings."
             )
         try:
-            async for text in _review_with_openai(user_message, model, key):
-                yield text
+            client = _get_openai_client(key)
+            stream = await client.responses.create(
+                model=model,
+                instructions=SYSTEM_PROMPT,
+                input=user_message,
+                stream=True,
+            )
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    parts.append(event.delta)
+                    yield event.delta
         except openai.APIError as e:
             raise Exception(f"Review failed for {filename}: {e}") from e
 
     else:
         raise Exception(f"Unknown provider: {provider}")
+
+    if len(_review_cache) >= _MAX_CACHED_REVIEWS:
+        _review_cache.clear()
+    _review_cache[cache_key] = "".join(parts)
@@ -2,12 +2,57 @@
 
 from __future__ import annotations
 
+import asyncio
 import collections.abc
 from typing import Any
 
 import reflex as rx
 
+from pr_reviewer.constants import (
+    DEFAULT_STATUS_GLYPH,
+    MAX_HIGHLIGHTED_DIFF_LINES,
+    MAX_RENDERED_DIFF_LINES,
+    STATUS_GLYPHS,
+)
 from pr_reviewer.services.github import fetch_pr_files, fetch_pr_metadata, parse_pr_url
+from pr_reviewer.services.highlight import highlight_diff
+
+
+def _prepare_files(
+    files: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    """Precompute display fields and split patch text out of each file dict.
+
+    Patch bodies can dwarf the rest of the file metadata, so they are kept
+    server-side and never serialized to the client as part of the reactive
+    files list. Each file dict gets a has_patch flag in their place, and
+    only the fields the UI reads are kept — the raw GitHub dicts carry
+    blob/raw/contents URLs and SHAs that would otherwise ride every state
+    delta.
+    """
+    slim_files: list[dict[str, Any]] = []
+    patches: dict[str, str] = {}
+    for f in files:
+        status = f.get("status", "")
+        glyph, color = STATUS_GLYPHS.get(status, DEFAULT_STATUS_GLYPH)
+        additions = f.get("additions", 0)
+        deletions = f.get("deletions", 0)
+        patch = f.get("patch", "") or ""
+        slim_files.append(
+            {
+                "filename": f.get("filename", ""),
+                "status": status,
+                "additions": additions,
+                "deletions": deletions,
+                "status_glyph": glyph,
+                "status_color": color,
+                "additions_label": f"+{additions}" if additions else "",
+                "deletions_label": f"-{deletions}" if deletions else "",
+                "has_patch": bool(patch.strip()),
+            }
+        )
+        patches[f.get("filename", "")] = patch
+    return slim_files, patches
 
 
 class PRDataState(rx.State):
@@ -19,7 +64,6 @@ class PRDataState(rx.State):
     # PR metadata (from GitHub API)
     pr_title: str = ""
     pr_author: str = ""
-    pr_description: str = ""
     pr_base_branch: str = ""
     pr_head_branch: str = ""
     total_additions: int = 0
@@ -38,6 +82,22 @@ class PRDataState(rx.State):
     file_drawer_open: bool = False
     description_expanded: bool = False
 
+    # Raw PR description body. Backend-only: the client receives it via
+    # visible_description only while the section is expanded.
+    _pr_description: str = ""
+
+    # Filename -> file dict index, rebuilt whenever files is assigned.
+    # Backend-only: never serialized to the client.
+    _files_by_name: dict[str, dict[str, Any]] = {}
+
+    # Filename -> patch text, kept server-side so patch bodies never ride
+    # along with the files list on the websocket.
+    _patches: dict[str, str] = {}
+
+    # (owner, repo, pr_number) of the currently loaded PR, so resubmitting
+    # the same URL doesn't reset state and refetch.
+    _loaded_key: tuple[str, str, int] | None = None
+
     def set_pr_url(self, value: str) -> None:
         """Set the PR URL."""
         self.pr_url = value
@@ -50,19 +110,41 @@ class PRDataState(rx.State):
     @rx.var
     def has_pr_description(self) -> bool:
         """Check if the PR has a description."""
-        return bool(self.pr_description and self.pr_description.strip())
+        return bool(self._pr_description)
+
+    @rx.var
+    def visible_description(self) -> str:
+        """Description text, shipped to the client only while expanded."""
+        return self._pr_description if self.description_expanded else ""
 
     @rx.var
     def file_count(self) -> int:
         """Get the number of files changed."""
         return len(self.files)
 
+    @rx.var
+    def file_count_label(self) -> str:
+        """Label like "7 files changed" for the metadata card."""
+        return f"{len(self.files)} files changed"
+
+    @rx.var
+    def total_additions_label(self) -> str:
+        """Formatted total additions for the metadata card."""
+        return f"+{self.total_additions}"
+
+    @rx.var
+    def total_deletions_label(self) -> str:
+        """Formatted total deletions for the metadata card."""
+        return f"-{self.total_deletions}"
+
+    @rx.var
+    def branch_label(self) -> str:
+        """Label like "main ← feature" for the metadata card."""
+        return f"{self.pr_base_branch} ← {self.pr_head_branch}"
+
     def _find_file_by_name(self, filename: str) -> dict[str, Any] | None:
-        """Find file data by filename."""
-        for f in self.files:
-            if f.get("filename") == filename:
-                return f
-        return None
+        """Find file data by filename via the precomputed index."""
+        return self._files_by_name.get(filename)
 
     @rx.var
     def selected_file_data(self) -> dict[str, Any] | None:
@@ -74,14 +156,55 @@ class PRDataState(rx.State):
     @rx.var
     def selected_file_diff(self) -> str:
         """Get the diff patch for the currently selected file."""
-        file_data = self.selected_file_data
-        return file_data.get("patch", "") if file_data else ""
+        return self._patches.get(self.selected_file, "")
 
     @rx.var
     def selected_file_has_diff(self) -> bool:
         """Check if the selected file has a diff available."""
         return bool(self.selected_file_diff)
 
+    @rx.var
+    def rendered_diff(self) -> str:
+        """Diff text capped to MAX_RENDERED_DIFF_LINES for display.
+
+        The full patch is kept for reviews; only the rendered copy is
+        windowed so the highlighter never tokenizes huge patches. Lines
+        are split on "\\n" only (not splitlines, which also breaks on
+        unicode separators) so this cap and rendered_diff_truncated
+        count lines identically.
+        """
+        diff = self.selected_file_diff
+        lines = diff.split("\n")
+        if len(lines) <= MAX_RENDERED_DIFF_LINES:
+            return diff
+        return "\n".join(lines[:MAX_RENDERED_DIFF_LINES])
+
+    @rx.var
+    def rendered_diff_truncated(self) -> bool:
+        """Check if the displayed diff was cut off at the line cap.
+
+        count("\\n") + 1 equals len(diff.split("\\n")), so this flag is
+        true exactly when rendered_diff dropped lines.
+        """
+        return self.selected_file_diff.count("\n") + 1 > MAX_RENDERED_DIFF_LINES
+
+    @rx.var
+    def rendered_diff_is_large(self) -> bool:
+        """Check if the displayed diff is too large to syntax highlight."""
+        return self.rendered_diff.count("\n") + 1 > MAX_HIGHLIGHTED_DIFF_LINES
+
+    @rx.var
+    def rendered_diff_html(self) -> str:
+        """Server-highlighted HTML for large diffs (empty for small ones).
+
+        Small diffs are highlighted client-side; large ones are rendered
+        once with Pygments on the server and cached, so the browser never
+        tokenizes them.
+        """
+        if not self.rendered_diff_is_large:
+            return ""
+        return highlight_diff(self.rendered_diff)
+
     @rx.var
     def selected_file_additions(self) -> int:
         """Get additions count for the selected file."""
@@ -94,6 +217,18 @@ class PRDataState(rx.State):
         file_data = self.selected_file_data
         return file_data.get("deletions", 0) if file_data else 0
 
+    @rx.var
+    def selected_file_additions_label(self) -> str:
+        """Formatted additions label for the diff header ("" when zero)."""
+        additions = self.selected_file_additions
+        return f"+{additions}" if additions else ""
+
+    @rx.var
+    def selected_file_deletions_label(self) -> str:
+        """Formatted deletions label for the diff header ("" when zero)."""
+        deletions = self.selected_file_deletions
+        return f"-{deletions}" if deletions else ""
+
     @rx.var
     def selected_file_status(self) -> str:
         """Get status for the selected file."""
@@ -111,6 +246,11 @@ class PRDataState(rx.State):
         review_state = await self.get_state(ReviewState)
         review_state.selected_file = filename
 
+    async def select_and_close(self, filename: str) -> None:
+        """Select a file and close the drawer in a single event."""
+        await self.select_file(filename)
+        self.file_drawer_open = False
+
     def toggle_description(self) -> None:
         """Toggle the description expanded state."""
         self.description_expanded = not self.description_expanded
@@ -132,12 +272,15 @@ class PRDataState(rx.State):
         self.error_message = ""
         self.pr_title = ""
         self.pr_author = ""
-        self.pr_description = ""
+        self._pr_description = ""
         self.pr_base_branch = ""
         self.pr_head_branch = ""
         self.total_additions = 0
         self.total_deletions = 0
         self.files = []
+        self._files_by_name = {}
+        self._patches = {}
+        self._loaded_key = None
         self.files_truncated = False
         self.selected_file = ""
         self.description_expanded = False
@@ -150,6 +293,12 @@ class PRDataState(rx.State):
         from pr_reviewer.state.review import ReviewState
         from pr_reviewer.state.settings import SettingsState
 
+        # Same PR already on screen: keep the loaded data (and any
+        # reviews) instead of blanking and refetching.
+        parsed = parse_pr_url(self.pr_url)
+        if parsed and parsed == self._loaded_key and self.files:
+            return
+
         self._reset_pr_state()
 
         # Reset ReviewState
@@ -160,7 +309,6 @@ class PRDataState(rx.State):
             self.error_message = "Please enter a PR URL"
             return
 
-        parsed = parse_pr_url(self.pr_url)
         if not parsed:
             self.error_message = (
                 "Invalid GitHub PR URL. Expected format: "
@@ -175,21 +323,29 @@ class PRDataState(rx.State):
         try:
             settings = await self.get_state(SettingsState)
             token = settings.github_token or None
-            metadata = await fetch_pr_metadata(owner, repo, pr_number, token=token)
+            # The two calls are independent; overlap them so the PR load
+            # costs one round trip instead of two.
+            metadata, files_data = await asyncio.gather(
+                fetch_pr_metadata(owner, repo, pr_number, token=token),
+                fetch_pr_files(owner, repo, pr_number, token=token),
+            )
             self.pr_title = metadata.get("title", "")
             self.pr_author = metadata.get("user", {}).get("login", "")
-            self.pr_description = metadata.get("body", "") or ""
+            self._pr_description = (metadata.get("body") or "").strip()
             self.pr_base_branch = metadata.get("base", {}).get("ref", "")
             self.pr_head_branch = metadata.get("head", {}).get("ref", "")
             self.total_additions = metadata.get("additions", 0)
             self.total_deletions = metadata.get("deletions", 0)
 
-            files_data = await fetch_pr_files(owner, repo, pr_number, token=token)
-            self.files = files_data.get("files", [])
+            self.files, self._patches = _prepare_files(files_data.get("files", []))
+            self._files_by_name = {
+                f["filename"]: f for f in self.files if "filename" in f
+            }
             self.files_truncated = files_data.get("truncated", False)
 
             # Sync files to ReviewState for computed var access
-            review_state.set_files(self.files)
+            review_state.set_files(self.files, self._patches)
+            self._loaded_key = parsed
         except Exception as e:
             self.error_message = str(e)
         finally:
@@ -1,19 +1,19 @@
 """Review state for AI code review functionality."""
 
-from __future__ import annotations
-
+import asyncio
 import collections.abc
+import time
 from typing import Any
 
 import reflex as rx
 
+from pr_reviewer.constants import MAX_CONCURRENT_REVIEWS
 from pr_reviewer.services.reviewer import review_diff
 
 
 class ReviewState(rx.State):
     """State for AI code review functionality."""
 
-    file_reviews: dict[str, str] = {}
     current_review_file: str = ""
     is_reviewing: bool = False
     review_error: str = ""
@@ -28,26 +28,73 @@ class ReviewState(rx.State):
     files: list[dict[str, Any]] = []
     selected_file: str = ""
 
-    def _set_file_review(self, filename: str, content: str) -> None:
-        """Set a file review, triggering proper state reactivity."""
-        updated = dict(self.file_reviews)
-        updated[filename] = content
-        self.file_reviews = updated
+    # Filename -> patch text, synced from PRDataState. Backend-only so
+    # patch bodies are never serialized to the client.
+    _patches: dict[str, str] = {}
+
+    # Reviewable subset of files, filtered once in set_files so the
+    # computed vars below don't re-scan the list on every read.
+    _reviewable_files: list[dict[str, Any]] = []
+    _reviewable_names: set[str] = set()
+
+    # Completed/in-progress review text per file. Backend-only: the
+    # client only ever needs the selected file's review, exposed via
+    # selected_file_review, so streaming flushes serialize one string
+    # instead of every review gathered so far.
+    _file_reviews: dict[str, str] = {}
+
+    # Count of reviewable files with an entry in _file_reviews, kept
+    # incrementally by _set_file_review so the progress vars read an int
+    # instead of re-walking the reviews dict.
+    _reviewed_count: int = 0
+
+    # Per-file chunk buffers during streaming. Chunks are appended in
+    # O(1) and only joined into _file_reviews when a flush pushes an
+    # update, instead of rebuilding the review string per chunk.
+    _review_buffers: dict[str, list[str]] = {}
 
-    def set_files(self, files: list[dict[str, Any]]) -> None:
-        """Set files for review (called after PR fetch)."""
+    def _set_file_review(self, filename: str, content: str) -> None:
+        """Set a file review.
+
+        Item assignment is enough: Reflex wraps dict vars in a mutable
+        proxy that marks the state dirty, so copying the whole dict per
+        update was pure overhead.
+        """
+        if filename not in self._file_reviews and filename in self._reviewable_names:
+            self._reviewed_count += 1
+        self._file_reviews[filename] = content
+
+    def _flush_review_buffer(self, filename: str) -> None:
+        """Join a file's streamed chunks into its visible review entry."""
+        buffer = self._review_buffers.get(filename)
+        if buffer is not None:
+            self._set_file_review(filename, "".join(buffer))
+
+    def set_files(self, files: list[dict[str, Any]], patches: dict[str, str]) -> None:
+        """Set files and their patches for review (called after PR fetch)."""
         self.files = files
-        self.file_reviews = {}
+        self._patches = patches
+        self._reviewable_files = [f for f in files if f.get("has_patch")]
+        self._reviewable_names = {
+            f["filename"] for f in self._reviewable_files if "filename" in f
+        }
+        self._file_reviews = {}
+        self._reviewed_count = 0
 
     def reset_review_state(self) -> None:
         """Reset all review-related state."""
-        self.file_reviews = {}
+        self._file_reviews = {}
+        self._reviewed_count = 0
         self.current_review_file = ""
         self.is_reviewing = False
         self.review_error = ""
         self.is_reviewing_all = False
         self.review_all_current_index = 0
         self.files = []
+        self._patches = {}
+        self._reviewable_files = []
+        self._reviewable_names = set()
+        self._review_buffers = {}
         self.selected_file = ""
 
     @rx.var
@@ -55,7 +102,7 @@ class ReviewState(rx.State):
         """Get the review for the currently selected file."""
         if not self.selected_file:
             return ""
-        return self.file_reviews.get(self.selected_file, "")
+        return self._file_reviews.get(self.selected_file, "")
 
     @rx.var
     def has_selected_file_review(self) -> bool:
@@ -70,18 +117,17 @@ class ReviewState(rx.State):
     @rx.var
     def reviewable_files(self) -> list[dict[str, Any]]:
         """Get files that have diffs and can be reviewed."""
-        return [f for f in self.files if f.get("patch", "").strip()]
+        return self._reviewable_files
 
     @rx.var
     def reviewable_file_count(self) -> int:
         """Get the count of reviewable files."""
-        return len(self.reviewable_files)
+        return len(self._reviewable_files)
 
     @rx.var
     def reviewed_file_count(self) -> int:
         """Get the count of files that have been reviewed."""
-        reviewable = self.reviewable_files
-        return len([f for f in reviewable if f.get("filename") in self.file_reviews])
+        return self._reviewed_count
 
     @rx.var
     def review_progress_text(self) -> str:
@@ -107,13 +153,7 @@ class ReviewState(rx.State):
         if not target_file:
             return
 
-        # Find the diff for this file
-        diff = ""
-        for f in self.files:
-            if f.get("filename") == target_file:
-                diff = f.get("patch", "")
-                break
-
+        diff = self._patches.get(target_file, "")
         if not diff:
             self.review_error = "No diff available for this file"
             return
@@ -121,24 +161,39 @@ class ReviewState(rx.State):
         self.review_error = ""
         self.is_reviewing = True
         self.current_review_file = target_file
+        self._review_buffers[target_file] = []
         self._set_file_review(target_file, "")
         yield
 
         try:
+            # Snapshot the settings into plain locals so the stream loop
+            # never touches the other state's var descriptors.
             settings = await self.get_state(SettingsState)
+            model, provider = settings.model, settings.provider
+            # Coalesce streamed chunks: each yield is a websocket delta
+            # plus a client render, so push updates every ~64 chars or
+            # 50ms rather than per token.
+            pending_chars = 0
+            last_yield = time.monotonic()
             async for chunk in review_diff(
                 target_file,
                 diff,
-                model=settings.model,
-                provider=settings.provider,
+                model=model,
+                provider=provider,
             ):
-                self._set_file_review(
-                    target_file, self.file_reviews.get(target_file, "") + chunk
-                )
-                yield
+                self._review_buffers[target_file].append(chunk)
+                pending_chars += len(chunk)
+                now = time.monotonic()
+                if pending_chars >= 64 or now - last_yield > 0.05:
+                    self._flush_review_buffer(target_file)
+                    yield
+                    pending_chars = 0
+                    last_yield = now
         except Exception as e:
             self.review_error = str(e)
         finally:
+            self._flush_review_buffer(target_file)
+            self._review_buffers.pop(target_file, None)
             self.is_reviewing = False
             self.current_review_file = ""
 
@@ -159,37 +214,72 @@ class ReviewState(rx.State):
         yield
 
         try:
+            # Snapshot the settings into plain locals; the workers close
+            # over these instead of re-reading the other state's vars
+            # per file.
             settings = await self.get_state(SettingsState)
+            model, provider = settings.model, settings.provider
+
+            # Queue of files still to review; a small pool of workers
+            # streams them concurrently so total time scales with the
+            # slowest batch rather than the sum of all reviews.
+            queue: asyncio.Queue[tuple[int, str, str]] = asyncio.Queue()
             for idx, file_data in enumerate(reviewable):
                 filename = file_data.get("filename", "")
-                diff = file_data.get("patch", "")
+                diff = self._patches.get(filename, "")
 
                 if not filename or not diff:
                     continue
 
                 # Skip already reviewed files
-                if filename in self.file_reviews:
+                if filename in self._file_reviews:
                     continue
 
-                self.review_all_current_index = idx
-                self.current_review_file = filename
-                self._set_file_review(filename, "")
-                yield
-
-                try:
-                    async for chunk in review_diff(
-                        filename,
-                        diff,
-                        model=settings.model,
-                        provider=settings.provider,
-                    ):
-                        self._set_file_review(
-                            filename, self.file_reviews.get(filename, "") + chunk
-                        )
-                        yield
-                except Exception as e:
-                    self._set_file_review(filename, f"Error: {e}")
+                queue.put_nowait((idx, filename, diff))
+
+            async def worker() -> None:
+                while True:
+                    try:
+                        idx, filename, diff = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+
+                    self.review_all_current_index = idx
+                    self.current_review_file = filename
+                    self._review_buffers[filename] = []
+                    self._set_file_review(filename, "")
+                    try:
+                        async for chunk in review_diff(
+                            filename,
+                            diff,
+                            model=model,
+                            provider=provider,
+                        ):
+                            self._review_buffers[filename].append(chunk)
+                    except Exception as e:
+                        self._review_buffers.pop(filename, None)
+                        self._set_file_review(filename, f"Error: {e}")
+
+            workers = [
+                asyncio.create_task(worker())
+                for _ in range(min(MAX_CONCURRENT_REVIEWS, queue.qsize()))
+            ]
+            all_done = asyncio.gather(*workers)
+            try:
+                # Push accumulated worker progress to the client at a
+                # steady cadence instead of per streamed chunk.
+                while not all_done.done():
+                    await asyncio.sleep(0.1)
+                    for filename in list(self._review_buffers):
+                        self._flush_review_buffer(filename)
                     yield
+                await all_done
+                for filename in list(self._review_buffers):
+                    self._flush_review_buffer(filename)
+            finally:
+                for task in workers:
+                    task.cancel()
+                self._review_buffers = {}
         finally:
             self.is_reviewing_all = False
             self.is_reviewing = False
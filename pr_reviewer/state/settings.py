@@ -5,11 +5,35 @@ import reflex as rx
 from pr_reviewer.constants import (
     DEFAULT_MODEL,
     DEFAULT_PROVIDER,
+    PROVIDERS,
     Provider,
     get_default_model_for_provider,
     get_models_for_provider,
 )
 
+# Display name -> provider id, built once at import for the settings select.
+_PROVIDER_BY_DISPLAY = {
+    display: provider for provider, (display, _) in PROVIDERS.items()
+}
+
+# Provider id -> display name, the reverse of the map above. These
+# tables are keyed as plain str (StrEnum members hash as their values)
+# so lookups with the str-typed provider var type-check.
+_PROVIDER_DISPLAY: dict[str, str] = {
+    provider: display for provider, (display, _) in PROVIDERS.items()
+}
+
+# Per-provider model_id -> display name and display name -> model_id
+# maps, built once at import so the display-name vars and setters below
+# are O(1) lookups instead of scans over the model list.
+_MODEL_DISPLAY_BY_ID: dict[str, dict[str, str]] = {
+    provider: dict(get_models_for_provider(provider)) for provider in Provider
+}
+_MODEL_ID_BY_DISPLAY: dict[str, dict[str, str]] = {
+    provider: {display: model_id for model_id, display in models.items()}
+    for provider, models in _MODEL_DISPLAY_BY_ID.items()
+}
+
 
 class SettingsState(rx.State):
     """State for settings configuration."""
@@ -19,6 +43,11 @@ class SettingsState(rx.State):
     provider: str = DEFAULT_PROVIDER
     model: str = DEFAULT_MODEL
 
+    # Set on first expand of the token help accordion and never cleared,
+    # so the help tree is omitted from the DOM until it is actually
+    # needed, then kept mounted.
+    token_help_opened: bool = False
+
     @rx.var
     def has_github_token(self) -> bool:
         """Check if a GitHub token is configured."""
@@ -27,11 +56,7 @@ class SettingsState(rx.State):
     @rx.var
     def provider_display_name(self) -> str:
         """Get the display name for the current provider."""
-        if self.provider == Provider.ANTHROPIC:
-            return "Anthropic"
-        elif self.provider == Provider.OPENAI:
-            return "OpenAI"
-        return self.provider
+        return _PROVIDER_DISPLAY.get(self.provider, self.provider)
 
     @rx.var
     def available_models(self) -> list[tuple[str, str]]:
@@ -46,10 +71,12 @@ class SettingsState(rx.State):
     @rx.var
     def model_display_name(self) -> str:
         """Get the display name for the current model."""
-        for model_id, display_name in self.available_models:
-            if model_id == self.model:
-                return display_name
-        return self.model
+        return _MODEL_DISPLAY_BY_ID.get(self.provider, {}).get(self.model, self.model)
+
+    def open_token_help(self, value: str | list[str]) -> None:
+        """Mark the token help accordion as opened at least once."""
+        if value:
+            self.token_help_opened = True
 
     def toggle_settings(self) -> None:
         """Toggle the settings panel."""
@@ -60,16 +87,19 @@ class SettingsState(rx.State):
         self.provider = value
         self.model = get_default_model_for_provider(value)
 
+    def set_provider_by_display_name(self, display_name: str) -> None:
+        """Set the AI provider from its display name."""
+        self.set_provider(_PROVIDER_BY_DISPLAY.get(display_name, DEFAULT_PROVIDER))
+
     def set_model(self, value: str) -> None:
         """Set the AI model by model ID."""
         self.model = value
 
     def set_model_by_display_name(self, display_name: str) -> None:
         """Set the AI model by display name."""
-        for model_id, name in self.available_models:
-            if name == display_name:
-                self.model = model_id
-                return
+        model_id = _MODEL_ID_BY_DISPLAY.get(self.provider, {}).get(display_name)
+        if model_id is not None:
+            self.model = model_id
 
     def set_github_token(self, value: str) -> None:
         """Set the GitHub token."""